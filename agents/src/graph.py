@@ -10,10 +10,18 @@ User Query → Router → Planner → Executor → Validator → Narrator → Re
                                     └───────────┘ (retry if needed)
 """
 
+import asyncio
+import contextlib
+import functools
 import os
+import random
+import time
 from typing import Optional, Literal, Union
+from uuid import uuid4
+from langgraph.checkpoint.memory import MemorySaver
 from langgraph.graph import StateGraph, END
 
+from . import state as state_models
 from .state import AgentState
 from .nodes import (
     RouterNode,
@@ -22,6 +30,7 @@ from .nodes import (
     ValidatorNode,
     NarratorNode,
 )
+from .nodes.base import is_rate_limit
 
 def _load_api_keys() -> list:
     """Load all API keys from environment variables."""
@@ -46,7 +55,24 @@ API_KEYS = _load_api_keys()
 
 # Track current API key index
 _current_key_index = 0
-_llm_instance = None
+_llm_cache_ready = False
+
+# Rate limiting: seconds a key rests after a 429, and a shared budget of
+# graph runs (each run may make several LLM calls)
+KEY_COOLDOWN_SECONDS = 60
+QUERIES_PER_MINUTE = 60
+# Attempts per query on rate limits: at least one per key, and enough that a
+# single key still gets backed-off retries
+RATE_LIMIT_ATTEMPTS = 3
+_key_cooldown_until: dict = {}  # key index -> time.monotonic() when usable again
+
+try:
+    from aiolimiter import AsyncLimiter
+except ImportError:
+    AsyncLimiter = None
+
+_query_limiter = None
+_query_limiter_loop = None
 
 
 def get_next_api_key() -> str:
@@ -64,41 +90,101 @@ def get_next_api_key() -> str:
     return API_KEYS[0]
 
 
-def rotate_api_key():
-    """Rotate to the next API key (call when rate limited)."""
-    global _current_key_index, _llm_instance
+def rotate_api_key(failed_index: Optional[int] = None):
+    """
+    Rotate to the next API key (call when rate limited).
+    failed_index is the key that hit the limit (default: the current one).
+    It is put in cooldown and keys still cooling down are skipped; if all
+    are, the one that frees up first is used. If another query already
+    rotated away from failed_index, this is a no-op.
+    """
+    global _current_key_index
     
     if not API_KEYS:
         return
     
-    _current_key_index = (_current_key_index + 1) % len(API_KEYS)
-    _llm_instance = None  # Force re-creation of LLM
+    if failed_index is None:
+        failed_index = _current_key_index
+    elif failed_index != _current_key_index:
+        return
+    
+    now = time.monotonic()
+    _key_cooldown_until[failed_index] = now + KEY_COOLDOWN_SECONDS
+    
+    candidates = [
+        (failed_index + i) % len(API_KEYS)
+        for i in range(1, len(API_KEYS) + 1)
+    ]
+    ready = [i for i in candidates if _key_cooldown_until.get(i, 0) <= now]
+    if ready:
+        _current_key_index = ready[0]
+    else:
+        _current_key_index = min(candidates, key=lambda i: _key_cooldown_until[i])
     
     print(f"Rotated to API key {_current_key_index + 1}/{len(API_KEYS)}")
 
 
+def _init_llm_cache():
+    """
+    Install a global in-memory LangChain LLM cache (once).
+    Identical prompts (router/narrator at temperature=0) are served from
+    the cache instead of a new API round-trip.
+    """
+    global _llm_cache_ready
+    
+    if _llm_cache_ready:
+        return
+    
+    from langchain_core.caches import InMemoryCache
+    from langchain_core.globals import set_llm_cache
+    
+    set_llm_cache(InMemoryCache())
+    
+    _llm_cache_ready = True
+
+
+def _get_query_limiter():
+    """Get the query rate limiter for the running event loop (no-op without aiolimiter)."""
+    global _query_limiter, _query_limiter_loop
+    
+    if AsyncLimiter is None:
+        return contextlib.nullcontext()
+    
+    # Limiters are bound to one event loop; run_query_sync starts a new one per call
+    loop = asyncio.get_running_loop()
+    if _query_limiter is None or _query_limiter_loop is not loop:
+        _query_limiter = AsyncLimiter(QUERIES_PER_MINUTE, 60)
+        _query_limiter_loop = loop
+    return _query_limiter
+
+
 def get_llm() -> Optional[Union["ChatGoogleGenerativeAI", "ChatOpenAI"]]:
     """
     Initialize LLM with rotating API keys.
     Supports multiple Gemini API keys with automatic rotation on rate limit.
     Returns None if no API key is configured (agent still works with rule-based logic).
     """
-    global _llm_instance
-    
-    if _llm_instance is not None:
-        return _llm_instance
-    
+    get_next_api_key()  # Keeps _current_key_index in range
+    return _get_llm_for(_current_key_index)
+
+
+@functools.cache
+def _get_llm_for(key_index: int) -> Optional[Union["ChatGoogleGenerativeAI", "ChatOpenAI"]]:
+    """
+    Build the LLM for API_KEYS[key_index].
+    Cached per index, so rotating back to a key reuses its client.
+    """
     # Try Gemini with rotating keys
-    api_key = get_next_api_key()
+    api_key = API_KEYS[key_index] if API_KEYS else None
     if api_key:
         try:
             from langchain_google_genai import ChatGoogleGenerativeAI
-            _llm_instance = ChatGoogleGenerativeAI(
+            _init_llm_cache()
+            return ChatGoogleGenerativeAI(
                 model="gemini-1.5-flash",  # Fast and free tier friendly
                 google_api_key=api_key,
                 temperature=0,
             )
-            return _llm_instance
         except ImportError:
             print("Warning: langchain-google-genai not installed. Run: pip install langchain-google-genai")
     
@@ -107,12 +193,12 @@ def get_llm() -> Optional[Union["ChatGoogleGenerativeAI", "ChatOpenAI"]]:
     if openai_key:
         try:
             from langchain_openai import ChatOpenAI
-            _llm_instance = ChatOpenAI(
+            _init_llm_cache()
+            return ChatOpenAI(
                 model="gpt-4o-mini",
                 temperature=0,
                 api_key=openai_key,
             )
-            return _llm_instance
         except ImportError:
             print("Warning: langchain-openai not installed. Run: pip install langchain-openai")
     
@@ -121,21 +207,36 @@ def get_llm() -> Optional[Union["ChatGoogleGenerativeAI", "ChatOpenAI"]]:
     return None
 
 
-def create_agent_graph():
+def _build_checkpointer() -> MemorySaver:
+    """In-memory checkpointer allowed to round-trip our pydantic state models."""
+    from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
+    
+    allowed = [
+        (state_models.__name__, name)
+        for name in ("AgentState", "TimeRange", "QueryEntities", "ToolCall",
+                     "ExecutionPlan", "ValidationResult")
+    ]
+    return MemorySaver(serde=JsonPlusSerializer(allowed_msgpack_modules=allowed))
+
+
+# Checkpoints let a rate-limited run resume from its last completed node
+_CHECKPOINTER = _build_checkpointer()
+
+
+def create_agent_graph(checkpointer: Optional[MemorySaver] = None):
     """
     Create the BNPL Analytics Agent graph.
     
     Returns a compiled LangGraph that can process queries.
+    With a checkpointer, invocations need a thread_id in their config.
     """
-    # Initialize LLM (optional - agent works without it)
-    llm = get_llm()
-    
-    # Initialize nodes
-    router = RouterNode(llm=llm)
-    planner = PlannerNode(llm=llm)
-    executor = ExecutorNode(llm=llm)
-    validator = ValidatorNode(llm=llm)
-    narrator = NarratorNode(llm=llm)
+    # Nodes resolve the LLM (optional - agent works without it) on each use,
+    # so key rotation swaps the model without rebuilding the graph
+    router = RouterNode(llm_provider=get_llm)
+    planner = PlannerNode(llm_provider=get_llm)
+    executor = ExecutorNode(llm_provider=get_llm)
+    validator = ValidatorNode(llm_provider=get_llm)
+    narrator = NarratorNode(llm_provider=get_llm)
     
     # Build the graph
     workflow = StateGraph(AgentState)
@@ -173,19 +274,13 @@ def create_agent_graph():
     workflow.add_edge("narrator", END)
     
     # Compile and return
-    return workflow.compile()
-
-
-# Create a singleton instance
-_agent_graph = None
+    return workflow.compile(checkpointer=checkpointer)
 
 
+@functools.cache
 def get_agent():
     """Get the singleton agent graph instance."""
-    global _agent_graph
-    if _agent_graph is None:
-        _agent_graph = create_agent_graph()
-    return _agent_graph
+    return create_agent_graph(checkpointer=_CHECKPOINTER)
 
 
 async def run_query(query: str, session_id: Optional[str] = None) -> str:
@@ -199,48 +294,80 @@ async def run_query(query: str, session_id: Optional[str] = None) -> str:
     Returns:
         Structured response string
     """
-    global _agent_graph
-    max_retries = max(len(API_KEYS), 1)  # Try all available keys
+    max_retries = max(len(API_KEYS), RATE_LIMIT_ATTEMPTS)
     
-    for attempt in range(max_retries):
-        try:
-            agent = get_agent()
-            
-            # Create initial state
-            initial_state = AgentState(
-                user_query=query,
-                session_id=session_id,
-            )
-            
-            # Run the graph
-            final_state = await agent.ainvoke(initial_state)
-            
-            # Return the response
-            if isinstance(final_state, dict):
-                return final_state.get("final_response", "No response generated")
-            return final_state.final_response or "No response generated"
-            
-        except Exception as e:
-            error_msg = str(e).lower()
-            # Check if rate limited or quota exceeded
-            if any(term in error_msg for term in ["rate limit", "quota", "429", "resource exhausted"]):
-                print(f"API rate limited (attempt {attempt + 1}/{max_retries}). Rotating key...")
-                rotate_api_key()
-                _agent_graph = None  # Force recreation of agent with new key
-            else:
-                # Not a rate limit error, re-raise
-                raise e
-    
-    return "Error: All API keys exhausted. Please try again later."
+    # One checkpoint thread per query, so state never leaks between queries
+    thread_id = f"{session_id or 'default'}:{uuid4().hex}"
+    config = {"configurable": {"thread_id": thread_id}}
+    
+    # Create initial state
+    graph_input = AgentState(
+        user_query=query,
+        session_id=session_id,
+    )
+    
+    try:
+        for attempt in range(max_retries):
+            try:
+                key_index = _current_key_index  # The key this attempt runs on
+                agent = get_agent()
+                
+                # Run the graph
+                async with _get_query_limiter():
+                    final_state = await agent.ainvoke(graph_input, config)
+                
+                # Return the response
+                if isinstance(final_state, dict):
+                    return final_state.get("final_response", "No response generated")
+                return final_state.final_response or "No response generated"
+                
+            except Exception as e:
+                # Nodes re-raise rate limit / quota errors instead of falling back
+                if is_rate_limit(e):
+                    print(f"API rate limited (attempt {attempt + 1}/{max_retries}). Rotating key...")
+                    # Nodes pick up the new key's LLM via get_llm
+                    rotate_api_key(key_index)
+                    
+                    # Resume from the last checkpoint instead of re-running router/planner
+                    graph_input = None
+                    
+                    # Exponential backoff with jitter before the next attempt
+                    if attempt < max_retries - 1:
+                        delay = 0.5 * (2 ** attempt) + random.random() * 0.25
+                        await asyncio.sleep(delay)
+                else:
+                    # Not a rate limit error, re-raise
+                    raise e
+        
+        return "Error: All API keys exhausted. Please try again later."
+    finally:
+        await _CHECKPOINTER.adelete_thread(thread_id)
+
+
+# Compile the graph up front so the first query doesn't pay for it.
+# Set AGENT_EAGER_COMPILE=false to skip (e.g. in tests).
+if os.getenv("AGENT_EAGER_COMPILE", "true").lower() not in ("0", "false", "no"):
+    get_agent()
+
+
+def run_async(coro):
+    """Run a coroutine on uvloop if installed, else on the default asyncio loop."""
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.run(coro)
+    return uvloop.run(coro)
 
 
 def run_query_sync(query: str, session_id: Optional[str] = None) -> str:
     """Synchronous version of run_query."""
-    import asyncio
-    return asyncio.run(run_query(query, session_id))
+    return run_async(run_query(query, session_id))
 
 
 # Demo function
+DEMO_CONCURRENCY = 3
+
+
 async def demo():
     """Run demo queries."""
     demo_queries = [
@@ -255,16 +382,22 @@ async def demo():
     print("BNPL Analytics Agent - Demo")
     print("=" * 60)
     
-    for query in demo_queries:
+    # Queries are independent; cap concurrency to stay within free-tier RPM
+    sem = asyncio.Semaphore(DEMO_CONCURRENCY)
+    
+    async def bounded(query: str) -> str:
+        async with sem:
+            return await run_query(query)
+    
+    responses = await asyncio.gather(*(bounded(q) for q in demo_queries))
+    
+    for query, response in zip(demo_queries, responses):
         print(f"\n{'='*60}")
         print(f"Query: {query}")
         print("=" * 60)
-        
-        response = await run_query(query)
         print(response)
         print()
 
 
 if __name__ == "__main__":
-    import asyncio
-    asyncio.run(demo())
+    run_async(demo())
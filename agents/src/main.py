@@ -5,7 +5,6 @@ Provides CLI interface for running the agent.
 """
 
 import argparse
-import asyncio
 import os
 import sys
 from pathlib import Path
@@ -64,12 +63,14 @@ Examples:
         logging.basicConfig(level=logging.DEBUG)
     
     # Run appropriate mode
+    from .graph import run_async
+    
     if args.demo:
-        asyncio.run(run_demo())
+        run_async(run_demo())
     elif args.query:
-        asyncio.run(run_single_query(args.query))
+        run_async(run_single_query(args.query))
     elif args.interactive:
-        asyncio.run(run_interactive())
+        run_async(run_interactive())
     else:
         parser.print_help()
 
@@ -0,0 +1,45 @@
+"""
+Base class for graph nodes that can use an LLM.
+
+Nodes take either a fixed ``llm`` or an ``llm_provider`` callable.
+With a provider, the LLM is looked up on every access, so API key
+rotation swaps the model without rebuilding the graph.
+
+Nodes fall back to rule-based logic on LLM errors, except rate limits:
+those are re-raised so run_query can back off and rotate keys.
+"""
+
+from typing import Callable, Optional
+from langchain_openai import ChatOpenAI
+
+
+RATE_LIMIT_TERMS = ("rate limit", "quota", "429", "resource exhausted", "resource has been exhausted")
+
+
+def is_rate_limit(exc: BaseException) -> bool:
+    """Whether exc is a provider rate-limit or quota error."""
+    if getattr(exc, "status_code", None) == 429:
+        return True
+    if type(exc).__name__ in ("RateLimitError", "ResourceExhausted"):
+        return True
+    message = str(exc).lower()
+    return any(term in message for term in RATE_LIMIT_TERMS)
+
+
+class LLMNode:
+    """Node with an optional LLM, fixed or resolved through a provider."""
+
+    def __init__(
+        self,
+        llm: Optional[ChatOpenAI] = None,
+        llm_provider: Optional[Callable[[], Optional[ChatOpenAI]]] = None,
+    ):
+        self._llm = llm
+        self._llm_provider = llm_provider
+
+    @property
+    def llm(self) -> Optional[ChatOpenAI]:
+        """The current LLM (None if not configured)."""
+        if self._llm_provider is not None:
+            return self._llm_provider()
+        return self._llm
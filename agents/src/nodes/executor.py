@@ -4,19 +4,21 @@ Executor Node - Calls MCP tools and collects results.
 Executes the plan created by the Planner node by:
 1. First validating schema (if needed)
 2. Calling the primary tool (KPI or SQL)
-3. Executing drill-down queries
+3. Executing drill-down queries (concurrently with the primary call)
 4. Collecting all results for the Validator
 """
 
+import asyncio
 import time
-from typing import Optional
+from typing import Callable, Optional
 from langchain_openai import ChatOpenAI
 
+from .base import LLMNode, is_rate_limit
 from ..state import AgentState, ToolCall
 from ..tools import SchemaTool, KPITool, SQLTool, RiskTool, TraceTool
 
 
-class ExecutorNode:
+class ExecutorNode(LLMNode):
     """
     Executes tool calls defined in the execution plan.
     
@@ -28,8 +30,12 @@ class ExecutorNode:
     - Trace logging
     """
     
-    def __init__(self, llm: Optional[ChatOpenAI] = None):
-        self.llm = llm
+    def __init__(
+        self,
+        llm: Optional[ChatOpenAI] = None,
+        llm_provider: Optional[Callable[[], Optional[ChatOpenAI]]] = None,
+    ):
+        super().__init__(llm=llm, llm_provider=llm_provider)
         self.schema_tool = SchemaTool()
         self.kpi_tool = KPITool()
         self.sql_tool = SQLTool()
@@ -47,8 +53,22 @@ class ExecutorNode:
         # Log execution start
         await self._log_trace(state, "execution_start")
         
-        # Execute primary query
-        primary_result = await self._execute_primary(state)
+        # Primary and drill-down queries are independent, so run them
+        # concurrently (bounded) and collect results in plan order
+        sem = asyncio.Semaphore(state.exec_concurrency)
+        
+        async def bounded(coro):
+            async with sem:
+                return await coro
+        
+        primary_result, *drill_results = await asyncio.gather(
+            bounded(self._execute_primary(state)),
+            *(
+                bounded(self._execute_drill_down(state, drill_down))
+                for drill_down in state.plan.drill_down_queries
+            ),
+        )
+        
         if primary_result:
             state.tool_calls.append(primary_result)
             if primary_result.result:
@@ -58,9 +78,7 @@ class ExecutorNode:
                     "result": primary_result.result,
                 })
         
-        # Execute drill-down queries
-        for drill_down in state.plan.drill_down_queries:
-            drill_result = await self._execute_drill_down(state, drill_down)
+        for drill_down, drill_result in zip(state.plan.drill_down_queries, drill_results):
             if drill_result:
                 state.tool_calls.append(drill_result)
                 if drill_result.result:
@@ -104,6 +122,8 @@ class ExecutorNode:
             )
             
         except Exception as e:
+            if is_rate_limit(e):
+                raise
             return ToolCall(
                 tool_name=plan.primary_tool,
                 parameters={"query": plan.primary_query},
@@ -180,6 +200,8 @@ class ExecutorNode:
             )
             
         except Exception as e:
+            if is_rate_limit(e):
+                raise
             return ToolCall(
                 tool_name="sql",
                 parameters={"drill_down": drill_down},
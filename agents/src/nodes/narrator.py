@@ -9,14 +9,15 @@ Transforms raw tool results into the standard output format:
 - Data & Assumptions
 """
 
-from typing import Optional, List
+from typing import Callable, Optional, List
 from langchain_openai import ChatOpenAI
 from langchain_core.prompts import ChatPromptTemplate
 
+from .base import LLMNode, is_rate_limit
 from ..state import AgentState, ResponseFormat
 
 
-class NarratorNode:
+class NarratorNode(LLMNode):
     """
     Generates a structured, human-readable response.
     
@@ -28,8 +29,12 @@ class NarratorNode:
     5. Data source attribution
     """
     
-    def __init__(self, llm: Optional[ChatOpenAI] = None):
-        self.llm = llm
+    def __init__(
+        self,
+        llm: Optional[ChatOpenAI] = None,
+        llm_provider: Optional[Callable[[], Optional[ChatOpenAI]]] = None,
+    ):
+        super().__init__(llm=llm, llm_provider=llm_provider)
         self._narrator_prompt = self._build_narrator_prompt()
     
     def _build_narrator_prompt(self) -> ChatPromptTemplate:
@@ -105,6 +110,8 @@ Generate the structured response:""")
             return response.content
             
         except Exception as e:
+            if is_rate_limit(e):
+                raise
             # Fallback to template
             return self._template_narrate(state)
     
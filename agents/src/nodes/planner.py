@@ -7,9 +7,10 @@ then creates an execution plan using either:
 2. SQL tool (for drill-downs or custom queries)
 """
 
-from typing import Optional
+from typing import Callable, Optional
 from langchain_openai import ChatOpenAI
 
+from .base import LLMNode
 from ..state import AgentState, ExecutionPlan
 from ..tools.kpi_tool import KPI_CATALOG
 
@@ -49,7 +50,7 @@ INTENT_TOOL_MAP = {
 }
 
 
-class PlannerNode:
+class PlannerNode(LLMNode):
     """
     Creates an execution plan based on intent and entities.
     
@@ -59,8 +60,12 @@ class PlannerNode:
     3. If custom query → use SQL tool with schema validation
     """
     
-    def __init__(self, llm: Optional[ChatOpenAI] = None):
-        self.llm = llm
+    def __init__(
+        self,
+        llm: Optional[ChatOpenAI] = None,
+        llm_provider: Optional[Callable[[], Optional[ChatOpenAI]]] = None,
+    ):
+        super().__init__(llm=llm, llm_provider=llm_provider)
     
     async def __call__(self, state: AgentState) -> AgentState:
         """Create execution plan."""
@@ -7,15 +7,28 @@ natural language query to determine:
 2. Entities (metrics, time window, filters, groupings)
 """
 
+import hashlib
+import logging
 import re
+from collections import OrderedDict
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Callable, Optional
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_openai import ChatOpenAI
 
+from .base import LLMNode, is_rate_limit
 from ..state import AgentState, QueryEntities, TimeRange
 
 
+logger = logging.getLogger("bnpl_agent.router")
+
+# Classification cache: normalized query -> (intent, entities)
+# Bump ROUTE_VERSION when patterns or the router prompt change.
+ROUTE_VERSION = 1
+ROUTE_CACHE_SIZE = 1024
+_route_cache: "OrderedDict[str, tuple]" = OrderedDict()
+
+
 # Intent patterns for rule-based classification
 INTENT_PATTERNS = {
     "growth_analytics": [
@@ -55,7 +68,7 @@ METRIC_PATTERNS = {
 }
 
 
-class RouterNode:
+class RouterNode(LLMNode):
     """
     Classifies user intent and extracts query entities.
     
@@ -64,8 +77,12 @@ class RouterNode:
     2. LLM fallback for ambiguous queries
     """
     
-    def __init__(self, llm: Optional[ChatOpenAI] = None):
-        self.llm = llm
+    def __init__(
+        self,
+        llm: Optional[ChatOpenAI] = None,
+        llm_provider: Optional[Callable[[], Optional[ChatOpenAI]]] = None,
+    ):
+        super().__init__(llm=llm, llm_provider=llm_provider)
         self._router_prompt = self._build_router_prompt()
     
     def _build_router_prompt(self) -> ChatPromptTemplate:
@@ -89,6 +106,15 @@ Respond in JSON format only."""),
         state.current_node = "router"
         query = state.user_query.lower()
         
+        key = self._cache_key(query)
+        cached = _route_cache.get(key)
+        if cached is not None:
+            logger.debug("Router cache hit for %r", state.user_query)
+            _route_cache.move_to_end(key)
+            state.intent = cached[0]
+            state.entities = cached[1].model_copy(deep=True)
+            return state
+        
         # 1. Classify intent
         state.intent = self._classify_intent(query)
         
@@ -96,11 +122,28 @@ Respond in JSON format only."""),
         state.entities = self._extract_entities(query)
         
         # 3. Use LLM for complex cases if available
+        cacheable = True
         if state.intent == "ad_hoc" and self.llm:
-            await self._llm_classify(state)
+            cacheable = await self._llm_classify(state)
+        
+        # Don't pin the rule-based fallback after a transient LLM failure
+        if cacheable:
+            _route_cache[key] = (state.intent, state.entities.model_copy(deep=True))
+            if len(_route_cache) > ROUTE_CACHE_SIZE:
+                _route_cache.popitem(last=False)
         
         return state
     
+    def _cache_key(self, query: str) -> str:
+        """
+        Cache key for a lowercased query.
+        Whitespace is collapsed; the date is included because time windows
+        are relative to today, and LLM availability because it changes ad_hoc results.
+        """
+        normalized = " ".join(query.split())
+        raw = f"{ROUTE_VERSION}|{self.llm is not None}|{datetime.now():%Y-%m-%d}|{normalized}"
+        return hashlib.md5(raw.encode()).hexdigest()
+    
     def _classify_intent(self, query: str) -> str:
         """Rule-based intent classification."""
         scores = {}
@@ -205,10 +248,10 @@ Respond in JSON format only."""),
         
         return group_by
     
-    async def _llm_classify(self, state: AgentState) -> None:
-        """Use LLM for complex classification."""
+    async def _llm_classify(self, state: AgentState) -> bool:
+        """Use LLM for complex classification. Returns False if the LLM call failed."""
         if not self.llm:
-            return
+            return False
         
         try:
             chain = self._router_prompt | self.llm
@@ -223,7 +266,10 @@ Respond in JSON format only."""),
                 state.entities.metrics.extend(result["metrics"])
             if result.get("group_by"):
                 state.entities.group_by.extend(result["group_by"])
+            return True
                 
-        except Exception:
+        except Exception as e:
+            if is_rate_limit(e):
+                raise
             # Keep rule-based classification
-            pass
+            return False
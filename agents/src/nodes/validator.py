@@ -11,13 +11,14 @@ Checks for:
 Can trigger retries with adjusted parameters.
 """
 
-from typing import Optional
+from typing import Callable, Optional
 from langchain_openai import ChatOpenAI
 
+from .base import LLMNode
 from ..state import AgentState, ValidationResult
 
 
-class ValidatorNode:
+class ValidatorNode(LLMNode):
     """
     Validates tool results and decides next steps.
     
@@ -27,8 +28,12 @@ class ValidatorNode:
     - Fail: Return error with explanation
     """
     
-    def __init__(self, llm: Optional[ChatOpenAI] = None):
-        self.llm = llm
+    def __init__(
+        self,
+        llm: Optional[ChatOpenAI] = None,
+        llm_provider: Optional[Callable[[], Optional[ChatOpenAI]]] = None,
+    ):
+        super().__init__(llm=llm, llm_provider=llm_provider)
     
     async def __call__(self, state: AgentState) -> AgentState:
         """Validate results and determine next steps."""
@@ -85,6 +85,7 @@ class AgentState(BaseModel):
     plan: Optional[ExecutionPlan] = None
     
     # Executor output
+    exec_concurrency: int = Field(default=4, description="Max concurrent tool calls")
     tool_calls: List[ToolCall] = Field(default_factory=list)
     raw_results: List[dict] = Field(default_factory=list)
     
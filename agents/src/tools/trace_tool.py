@@ -147,7 +147,8 @@ class TraceTool(BaseTool):
         # Try Langfuse first
         if self._langfuse_available and self._langfuse_client:
             try:
-                self._log_to_langfuse(payload)
+                # The Langfuse client is sync; keep it off the event loop
+                await asyncio.to_thread(self._log_to_langfuse, payload)
                 return f"Trace logged to Langfuse: {event_type}"
             except Exception as e:
                 # Fall through to MCP
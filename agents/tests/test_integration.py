@@ -3,6 +3,10 @@ Integration tests for the full agent workflow.
 """
 
 import pytest
+from langchain_core.messages import AIMessage
+from langchain_core.runnables import RunnableLambda
+from src import graph
+from src.nodes import ExecutorNode, RouterNode
 from src.graph import run_query, create_agent_graph
 from src.state import AgentState
 
@@ -82,3 +86,114 @@ class TestGraphConstruction:
         
         # Graph should be compiled and runnable
         assert hasattr(graph, "ainvoke")
+
+
+class TestApiKeyRotation:
+    """Test key rotation and cooldown on rate limits."""
+    
+    @pytest.fixture(autouse=True)
+    def keys(self, monkeypatch):
+        """Three fake keys, starting on the first, none cooling down."""
+        monkeypatch.setattr(graph, "API_KEYS", ["key-1", "key-2", "key-3"])
+        monkeypatch.setattr(graph, "_current_key_index", 0)
+        monkeypatch.setattr(graph, "_key_cooldown_until", {})
+        monkeypatch.setattr(graph.time, "monotonic", lambda: 1000.0)
+    
+    def test_rotation_cools_down_failed_key(self):
+        """Test the failing key goes into cooldown and the next key is used."""
+        graph.rotate_api_key(0)
+        
+        assert graph._current_key_index == 1
+        assert graph._key_cooldown_until == {0: 1000.0 + graph.KEY_COOLDOWN_SECONDS}
+    
+    def test_rotation_skips_cooling_keys(self):
+        """Test keys still in cooldown are skipped."""
+        graph._key_cooldown_until[1] = 1030.0
+        
+        graph.rotate_api_key(0)
+        
+        assert graph._current_key_index == 2
+    
+    def test_rotation_all_cooling_picks_first_free(self):
+        """Test the key that frees up first is used when all are cooling down."""
+        graph._key_cooldown_until.update({1: 1050.0, 2: 1020.0})
+        
+        graph.rotate_api_key(0)
+        
+        assert graph._current_key_index == 2
+    
+    def test_stale_rotation_is_noop(self):
+        """Test concurrent failures on one key rotate only once."""
+        for _ in range(3):
+            graph.rotate_api_key(0)
+        
+        assert graph._current_key_index == 1
+        assert list(graph._key_cooldown_until) == [0]
+
+
+class TestCheckpointResume:
+    """Test rate-limited runs resume from the last checkpoint."""
+    
+    @pytest.mark.asyncio
+    async def test_rate_limit_resumes_without_rerouting(self, monkeypatch):
+        """Test an LLM 429 in the narrator rotates keys and resumes at the narrator."""
+        def limited_llm(prompt):
+            raise RuntimeError("429 Resource has been exhausted (e.g. check quota).")
+        
+        def working_llm(prompt):
+            return AIMessage(content="[Answer Summary] GMV narrated by key 2")
+        
+        llms = [RunnableLambda(limited_llm), RunnableLambda(working_llm)]
+        monkeypatch.setattr(graph, "API_KEYS", ["key-1", "key-2"])
+        monkeypatch.setattr(graph, "_current_key_index", 0)
+        monkeypatch.setattr(graph, "_key_cooldown_until", {})
+        monkeypatch.setattr(graph, "_get_llm_for", lambda key_index: llms[key_index])
+        
+        calls = {"router": 0, "executor": 0}
+        
+        # _cache_key runs on every router pass, cached or not
+        cache_key = RouterNode._cache_key
+        def counting_cache_key(self, query):
+            calls["router"] += 1
+            return cache_key(self, query)
+        
+        execute_primary = ExecutorNode._execute_primary
+        async def counting_execute_primary(self, state):
+            calls["executor"] += 1
+            return await execute_primary(self, state)
+        
+        monkeypatch.setattr(RouterNode, "_cache_key", counting_cache_key)
+        monkeypatch.setattr(ExecutorNode, "_execute_primary", counting_execute_primary)
+        
+        response = await run_query("What was our GMV last month?", session_id="resume-test")
+        
+        assert response == "[Answer Summary] GMV narrated by key 2"
+        assert calls == {"router": 1, "executor": 1}
+        assert graph._current_key_index == 1
+        assert 0 in graph._key_cooldown_until
+        
+        # The query's checkpoint thread is deleted once it finishes
+        threads = {c.config["configurable"]["thread_id"] for c in graph._CHECKPOINTER.list(None)}
+        assert not any(t.startswith("resume-test:") for t in threads)
+    
+    @pytest.mark.asyncio
+    async def test_single_key_retries_after_rate_limit(self, monkeypatch):
+        """Test one configured key still gets a backed-off retry on a 429."""
+        calls = []
+        
+        def flaky_llm(prompt):
+            calls.append(prompt)
+            if len(calls) == 1:
+                raise RuntimeError("429 Resource has been exhausted (e.g. check quota).")
+            return AIMessage(content="[Answer Summary] GMV after retry")
+        
+        llm = RunnableLambda(flaky_llm)
+        monkeypatch.setattr(graph, "API_KEYS", ["key-1"])
+        monkeypatch.setattr(graph, "_current_key_index", 0)
+        monkeypatch.setattr(graph, "_key_cooldown_until", {})
+        monkeypatch.setattr(graph, "_get_llm_for", lambda key_index: llm)
+        
+        response = await run_query("What was our GMV last month?")
+        
+        assert response == "[Answer Summary] GMV after retry"
+        assert len(calls) == 2
@@ -3,6 +3,10 @@ Tests for the Router node.
 """
 
 import pytest
+from collections import OrderedDict
+from langchain_core.messages import AIMessage
+from langchain_core.runnables import RunnableLambda
+from src.nodes import router as router_module
 from src.nodes.router import RouterNode
 from src.state import AgentState
 
@@ -10,6 +14,11 @@ from src.state import AgentState
 class TestRouterNode:
     """Test cases for intent classification and entity extraction."""
     
+    @pytest.fixture(autouse=True)
+    def empty_route_cache(self, monkeypatch):
+        """Give each test its own classification cache."""
+        monkeypatch.setattr(router_module, "_route_cache", OrderedDict())
+    
     @pytest.fixture
     def router(self):
         """Create router instance without LLM."""
@@ -91,3 +100,60 @@ class TestRouterNode:
         result = await router(state)
         
         assert result.entities.limit == 10
+    
+    @pytest.mark.asyncio
+    async def test_cached_classification_normalized(self, router):
+        """Test case/whitespace variants reuse the cached classification."""
+        first = await router(AgentState(user_query="GMV by merchant last month"))
+        second = await router(AgentState(user_query="  gmv BY merchant   LAST month "))
+        
+        assert second.intent == first.intent
+        assert second.entities == first.entities
+    
+    @pytest.mark.asyncio
+    async def test_cached_entities_are_copies(self, router):
+        """Test mutating routed entities does not leak into the cache."""
+        first = await router(AgentState(user_query="What is our GMV by city?"))
+        first.entities.group_by.append("category")
+        first.entities.time_window.start_date = "2000-01-01"
+        
+        second = await router(AgentState(user_query="What is our GMV by city?"))
+        
+        assert second.entities.group_by == ["city"]
+        assert second.entities.time_window.start_date != "2000-01-01"
+    
+    @pytest.mark.asyncio
+    async def test_failed_llm_classification_not_cached(self):
+        """Test a failing LLM call leaves the query uncached so it is retried."""
+        calls = []
+        
+        def flaky_llm(prompt):
+            calls.append(prompt)
+            if len(calls) == 1:
+                return AIMessage(content="not json")
+            return AIMessage(content='{"intent": "funnel"}')
+        
+        router = RouterNode(llm=RunnableLambda(flaky_llm))
+        query = "Tell me something surprising about last quarter"
+        
+        first = await router(AgentState(user_query=query))
+        second = await router(AgentState(user_query=query))
+        third = await router(AgentState(user_query=query))
+        
+        assert first.intent == "ad_hoc"
+        assert second.intent == "funnel"
+        assert third.intent == "funnel"
+        assert len(calls) == 2
+    
+    @pytest.mark.asyncio
+    async def test_rate_limit_is_raised(self):
+        """Test a 429 from the LLM reaches the caller instead of the rule-based fallback."""
+        def limited_llm(prompt):
+            raise RuntimeError("429 Resource has been exhausted (e.g. check quota).")
+        
+        router = RouterNode(llm=RunnableLambda(limited_llm))
+        
+        with pytest.raises(RuntimeError, match="429"):
+            await router(AgentState(user_query="Tell me something surprising about last quarter"))
+        
+        assert not router_module._route_cache
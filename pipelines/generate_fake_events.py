@@ -1,8 +1,10 @@
-import random
+import secrets
 from datetime import datetime, timedelta, timezone
-from uuid import uuid4
 
-from ingest_events import append_event
+import numpy as np
+import pandas as pd
+
+from ingest_events import BRONZE_PATH, append_events
 
 # =========================
 # CONFIG
@@ -25,220 +27,245 @@ MERCHANT_PERSONAS = {
     "risky": 0.3
 }
 
+# Per-persona (low, high) ranges, both inclusive
+ORDERS_PER_USER = {
+    "good": (2, 4),
+    "average": (1, 3),
+    "risky": (2, 5)
+}
+
+ORDER_AMOUNT = {
+    "good": (300, 900),
+    "average": (600, 1800),
+    "risky": (1500, 4000)
+}
+
+LATE_PROB = {
+    "good": 0.03,
+    "average": 0.15,
+    "risky": 0.45
+}
+
 CITIES = ["Casablanca", "Rabat", "Marrakech"]
 MERCHANT_CATEGORIES = ["electronics", "fashion", "travel", "home"]
 
+# Persona lookups, built once: index i of every array is USER_PERSONA_KEYS[i]
+USER_PERSONA_KEYS = np.array(list(USER_PERSONAS))
+USER_PERSONA_P = np.array(list(USER_PERSONAS.values()))
+ORDERS_LO, ORDERS_HI = np.array([ORDERS_PER_USER[p] for p in USER_PERSONA_KEYS]).T
+AMOUNT_LO, AMOUNT_HI = np.array([ORDER_AMOUNT[p] for p in USER_PERSONA_KEYS]).T
+LATE_PROB_BY_PERSONA = np.array([LATE_PROB[p] for p in USER_PERSONA_KEYS])
+
+MERCHANT_PERSONA_KEYS = np.array(list(MERCHANT_PERSONAS))
+MERCHANT_PERSONA_P = np.array(list(MERCHANT_PERSONAS.values()))
+
+rng = np.random.default_rng()
+
 # =========================
 # HELPERS
 # =========================
-def uid(prefix):
-    return f"{prefix}_{uuid4().hex[:8]}"
+def uids(prefix, n):
+    # One CSPRNG draw for the whole batch, cut into 8-hex-char suffixes
+    suffixes = np.frombuffer(secrets.token_hex(4 * n).encode(), dtype="S8").astype(str)
+    return np.char.add(f"{prefix}_", suffixes)
 
-def weighted_choice(dist):
-    r = random.random()
-    s = 0
-    for k, v in dist.items():
-        s += v
-        if r <= s:
-            return k
-    return k
+def days(n):
+    return pd.to_timedelta(n, unit="D")
 
-def rand_date(start, max_days):
-    return start + timedelta(days=random.randint(0, max_days))
+def make_events(event_type, ts, user_id, payload_json,
+                merchant_id=None, order_id=None, device_id=None, city=None):
+    return pd.DataFrame({
+        "event_id": uids("evt", len(ts)),
+        "event_type": event_type,
+        "ts": ts,
+        "user_id": user_id,
+        "merchant_id": merchant_id,
+        "order_id": order_id,
+        "device_id": device_id,
+        "city": city,
+        "payload_json": payload_json
+    })
 
 # =========================
 # CREATE MERCHANTS
 # =========================
-merchants = []
-for _ in range(NUM_MERCHANTS):
-    merchants.append({
-        "merchant_id": uid("merchant"),
-        "persona": weighted_choice(MERCHANT_PERSONAS),
-        "category": random.choice(MERCHANT_CATEGORIES)
-    })
+merchant_ids = uids("merchant", NUM_MERCHANTS)
+merchant_persona = rng.choice(MERCHANT_PERSONA_KEYS, NUM_MERCHANTS, p=MERCHANT_PERSONA_P)
+merchant_risky = merchant_persona == "risky"
+merchant_category = rng.choice(MERCHANT_CATEGORIES, NUM_MERCHANTS)
 
 # =========================
-# GENERATE USERS & EVENTS
+# GENERATE USERS
 # =========================
-for _ in range(NUM_USERS):
-    user_id = uid("user")
-    user_persona = weighted_choice(USER_PERSONAS)
-    signup_date = rand_date(START_DATE, 20)
-
-    # ---------- SIGNUP ----------
-    append_event({
-        "event_id": uid("evt"),
-        "event_type": "SIGNUP",
-        "ts": signup_date,
-        "user_id": user_id,
-        "merchant_id": None,
-        "order_id": None,
-        "device_id": uid("dev"),
-        "city": random.choice(CITIES),
-        "payload_json": {"signup_channel": "mobile"}
-    })
+persona_idx = rng.choice(len(USER_PERSONA_KEYS), NUM_USERS, p=USER_PERSONA_P)
+user_persona = USER_PERSONA_KEYS[persona_idx]
 
-    # ---------- KYC ----------
-    kyc_level = {
-        "good": "full",
-        "average": random.choice(["basic", "full"]),
-        "risky": "basic"
-    }[user_persona]
-
-    append_event({
-        "event_id": uid("evt"),
-        "event_type": "KYC_OK",
-        "ts": signup_date + timedelta(days=1),
-        "user_id": user_id,
-        "merchant_id": None,
-        "order_id": None,
-        "device_id": None,
-        "city": None,
-        "payload_json": {"kyc_level": kyc_level}
-    })
+user_ids = uids("user", NUM_USERS)
+signup_date = pd.Timestamp(START_DATE) + days(rng.integers(0, 21, NUM_USERS))
+
+# ---------- KYC ----------
+kyc_level = np.where(
+    user_persona == "good", "full",
+    np.where(user_persona == "risky", "basic", rng.choice(["basic", "full"], NUM_USERS))
+)
+
+signups = make_events(
+    "SIGNUP", signup_date, user_ids,
+    [{"signup_channel": "mobile"} for _ in range(NUM_USERS)],
+    device_id=uids("dev", NUM_USERS),
+    city=rng.choice(CITIES, NUM_USERS)
+)
+
+kycs = make_events(
+    "KYC_OK", signup_date + days(1), user_ids,
+    [{"kyc_level": k} for k in kyc_level.tolist()]
+)
+
+# =========================
+# GENERATE ORDERS
+# =========================
+orders_per_user = rng.integers(ORDERS_LO[persona_idx], ORDERS_HI[persona_idx] + 1)
+
+order_user = np.repeat(np.arange(NUM_USERS), orders_per_user)
+n_orders = len(order_user)
+order_persona_idx = persona_idx[order_user]
+order_merchant = rng.integers(0, NUM_MERCHANTS, n_orders)
+
+order_ids = uids("order", n_orders)
+order_date = signup_date[order_user] + days(rng.integers(0, 81, n_orders))
+
+amount = rng.integers(AMOUNT_LO[order_persona_idx], AMOUNT_HI[order_persona_idx] + 1)
+
+# ---------- APPROVAL LOGIC ----------
+order_user_risky = user_persona[order_user] == "risky"
+order_kyc_basic = kyc_level[order_user] == "basic"
+order_merchant_risky = merchant_risky[order_merchant]
+
+reject_prob = (
+    0.25 * order_user_risky
+    + 0.25 * order_kyc_basic
+    + 0.2 * (amount > 2500)
+    + 0.1 * order_merchant_risky
+)
+is_rejected = rng.random(n_orders) < reject_prob
+
+orders = make_events(
+    np.where(is_rejected, "ORDER_REJ", "ORDER_OK"), order_date,
+    user_ids[order_user],
+    [
+        {
+            "amount": a,
+            "currency": "MAD",
+            "installments_count": INSTALLMENTS_PER_ORDER,
+            "merchant_category": c
+        }
+        for a, c in zip(amount.tolist(), merchant_category[order_merchant].tolist())
+    ],
+    merchant_id=merchant_ids[order_merchant],
+    order_id=order_ids
+)
+
+# Only approved orders go on to installments and disputes
+approved = np.flatnonzero(~is_rejected)
+
+# =========================
+# INSTALLMENTS
+# =========================
+# Rows are approved orders, columns are installment numbers 1..INSTALLMENTS_PER_ORDER
+inst_shape = (len(approved), INSTALLMENTS_PER_ORDER)
+inst_offsets = (30 * np.arange(1, INSTALLMENTS_PER_ORDER + 1)).astype("timedelta64[D]")
+due_dates = order_date[approved].values[:, None] + inst_offsets
+
+# ---------- LATE / PAID ----------
+late_prob = (
+    LATE_PROB_BY_PERSONA[order_persona_idx[approved]]
+    + 0.15 * order_merchant_risky[approved]
+    + 0.1 * order_kyc_basic[approved]
+)
+late_mask = rng.random(inst_shape) < late_prob[:, None]
+late_days_2d = rng.integers(3, 13, inst_shape)
+early_days = rng.integers(0, GRACE_DAYS + 1, inst_shape)
+paid_dates = due_dates + np.where(late_mask, late_days_2d, -early_days).astype("timedelta64[D]")
+
+# Flatten row-major: one row per installment, grouped by order
+inst_order = np.repeat(approved, INSTALLMENTS_PER_ORDER)
+n_inst = len(inst_order)
+due_date = pd.to_datetime(due_dates.ravel(), utc=True)
+paid_date = pd.to_datetime(paid_dates.ravel(), utc=True)
+is_late = late_mask.ravel()
+late_days = late_days_2d.ravel()
+
+inst_ids = uids("inst", n_inst)
+inst_user_id = user_ids[order_user[inst_order]]
+inst_merchant_id = merchant_ids[order_merchant[inst_order]]
+inst_order_id = order_ids[inst_order]
+inst_amount = amount[inst_order] / INSTALLMENTS_PER_ORDER
+
+installments_due = make_events(
+    "INST_DUE", due_date, inst_user_id,
+    [
+        {"installment_id": i, "due_date": d, "installment_amount": a}
+        for i, d, a in zip(inst_ids.tolist(), due_date.strftime("%Y-%m-%d"), inst_amount.tolist())
+    ],
+    merchant_id=inst_merchant_id,
+    order_id=inst_order_id
+)
+
+installments_late = make_events(
+    "INST_LATE", paid_date[is_late], inst_user_id[is_late],
+    [
+        {"installment_id": i, "late_days": d}
+        for i, d in zip(inst_ids[is_late].tolist(), late_days[is_late].tolist())
+    ],
+    merchant_id=inst_merchant_id[is_late],
+    order_id=inst_order_id[is_late]
+)
+
+on_time = ~is_late
+installments_paid = make_events(
+    "INST_PAID", paid_date[on_time], inst_user_id[on_time],
+    [
+        {
+            "installment_id": i,
+            "paid_date": d,
+            "installment_amount": a,
+            "payment_channel": c
+        }
+        for i, d, a, c in zip(
+            inst_ids[on_time].tolist(),
+            paid_date[on_time].strftime("%Y-%m-%d"),
+            inst_amount[on_time].tolist(),
+            rng.choice(["card", "wallet"], int(on_time.sum())).tolist()
+        )
+    ],
+    merchant_id=inst_merchant_id[on_time],
+    order_id=inst_order_id[on_time]
+)
+
+# =========================
+# DISPUTES
+# =========================
+disputed = approved[
+    order_user_risky[approved]
+    & order_merchant_risky[approved]
+    & (rng.random(len(approved)) < 0.25)
+]
+
+disputes = make_events(
+    "DISPUTE", order_date[disputed] + days(15), user_ids[order_user[disputed]],
+    [{"dispute_reason": "refund", "dispute_amount": a} for a in amount[disputed].tolist()],
+    merchant_id=merchant_ids[order_merchant[disputed]],
+    order_id=order_ids[disputed]
+)
+
+append_events(pd.concat([
+    signups,
+    kycs,
+    orders,
+    installments_due,
+    installments_late,
+    installments_paid,
+    disputes
+], ignore_index=True))
 
-    # ---------- ORDERS ----------
-    orders_count = {
-        "good": random.randint(2, 4),
-        "average": random.randint(1, 3),
-        "risky": random.randint(2, 5)
-    }[user_persona]
-
-    for _ in range(orders_count):
-        merchant = random.choice(merchants)
-        order_id = uid("order")
-        order_date = rand_date(signup_date, 80)
-
-        amount = {
-            "good": random.randint(300, 900),
-            "average": random.randint(600, 1800),
-            "risky": random.randint(1500, 4000)
-        }[user_persona]
-
-        # ---------- APPROVAL LOGIC ----------
-        reject_prob = 0.0
-
-        if user_persona == "risky":
-            reject_prob += 0.25
-        if kyc_level == "basic":
-            reject_prob += 0.25
-        if amount > 2500:
-            reject_prob += 0.2
-        if merchant["persona"] == "risky":
-            reject_prob += 0.1
-
-        is_rejected = random.random() < reject_prob
-        event_type = "ORDER_REJ" if is_rejected else "ORDER_OK"
-
-        append_event({
-            "event_id": uid("evt"),
-            "event_type": event_type,
-            "ts": order_date,
-            "user_id": user_id,
-            "merchant_id": merchant["merchant_id"],
-            "order_id": order_id,
-            "device_id": None,
-            "city": None,
-            "payload_json": {
-                "amount": amount,
-                "currency": "MAD",
-                "installments_count": INSTALLMENTS_PER_ORDER,
-                "merchant_category": merchant["category"]
-            }
-        })
-
-        # ❌ STOP HERE if rejected
-        if is_rejected:
-            continue
-
-        # ---------- INSTALLMENTS ----------
-        inst_amount = amount / INSTALLMENTS_PER_ORDER
-
-        for i in range(INSTALLMENTS_PER_ORDER):
-            inst_id = uid("inst")
-            due_date = order_date + timedelta(days=30 * (i + 1))
-
-            append_event({
-                "event_id": uid("evt"),
-                "event_type": "INST_DUE",
-                "ts": due_date,
-                "user_id": user_id,
-                "merchant_id": merchant["merchant_id"],
-                "order_id": order_id,
-                "device_id": None,
-                "city": None,
-                "payload_json": {
-                    "installment_id": inst_id,
-                    "due_date": due_date.date().isoformat(),
-                    "installment_amount": inst_amount
-                }
-            })
-
-            late_prob = {
-                "good": 0.03,
-                "average": 0.15,
-                "risky": 0.45
-            }[user_persona]
-
-            if merchant["persona"] == "risky":
-                late_prob += 0.15
-            if kyc_level == "basic":
-                late_prob += 0.1
-
-            if random.random() < late_prob:
-                paid_date = due_date + timedelta(days=random.randint(3, 12))
-                append_event({
-                    "event_id": uid("evt"),
-                    "event_type": "INST_LATE",
-                    "ts": paid_date,
-                    "user_id": user_id,
-                    "merchant_id": merchant["merchant_id"],
-                    "order_id": order_id,
-                    "device_id": None,
-                    "city": None,
-                    "payload_json": {
-                        "installment_id": inst_id,
-                        "late_days": (paid_date - due_date).days
-                    }
-                })
-            else:
-                paid_date = due_date - timedelta(days=random.randint(0, GRACE_DAYS))
-                append_event({
-                    "event_id": uid("evt"),
-                    "event_type": "INST_PAID",
-                    "ts": paid_date,
-                    "user_id": user_id,
-                    "merchant_id": merchant["merchant_id"],
-                    "order_id": order_id,
-                    "device_id": None,
-                    "city": None,
-                    "payload_json": {
-                        "installment_id": inst_id,
-                        "paid_date": paid_date.date().isoformat(),
-                        "installment_amount": inst_amount,
-                        "payment_channel": random.choice(["card", "wallet"])
-                    }
-                })
-
-        # ---------- DISPUTES ----------
-        if (
-            user_persona == "risky"
-            and merchant["persona"] == "risky"
-            and random.random() < 0.25
-        ):
-            append_event({
-                "event_id": uid("evt"),
-                "event_type": "DISPUTE",
-                "ts": order_date + timedelta(days=15),
-                "user_id": user_id,
-                "merchant_id": merchant["merchant_id"],
-                "order_id": order_id,
-                "device_id": None,
-                "city": None,
-                "payload_json": {
-                    "dispute_reason": "refund",
-                    "dispute_amount": amount
-                }
-            })
-
-print("✅ Strong, realistic BNPL fake data generated")
+print(f"✅ Strong, realistic BNPL fake data generated in {BRONZE_PATH}")
@@ -1,20 +1,246 @@
-import json
+import asyncio
+import atexit
+import threading
+import orjson
+import pandas as pd
+import pyarrow as pa
+import pyarrow.json as pj
+import pyarrow.parquet as pq
 from pathlib import Path
 from datetime import datetime, timezone
+from uuid import uuid4
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+
+# Parquet dataset of part files, one row group per batch
+BRONZE_PATH = PROJECT_ROOT / "data" / "bronze" / "bnpl_events"
+# Legacy JSON-lines events written before the Parquet switch
+BRONZE_JSON_PATH = PROJECT_ROOT / "data" / "bronze" / "bnpl_events.json"
+BATCH_SIZE = 1000
+# A part becomes visible to readers when it is closed: at exit, or at
+# whichever of these bounds it reaches first
+PART_MAX_ROWS = 100_000
+PART_MAX_SECONDS = 30
+
+# payload_json is the union of all payload fields in schemas/events_schema.md;
+# fields an event type doesn't use are null. payload_raw keeps the payload
+# verbatim as JSON, so fields outside this struct are never lost.
+PAYLOAD_TYPE = pa.struct([
+    pa.field("signup_channel", pa.string()),
+    pa.field("referral_code", pa.string()),
+    pa.field("kyc_level", pa.string()),
+    pa.field("verification_provider", pa.string()),
+    pa.field("amount", pa.float64()),
+    pa.field("currency", pa.string()),
+    pa.field("installments_count", pa.int64()),
+    pa.field("credit_limit_used", pa.float64()),
+    pa.field("merchant_category", pa.string()),
+    pa.field("rejection_reason", pa.string()),
+    pa.field("installment_id", pa.string()),
+    pa.field("due_date", pa.string()),
+    pa.field("installment_amount", pa.float64()),
+    pa.field("paid_date", pa.string()),
+    pa.field("payment_channel", pa.string()),
+    pa.field("late_days", pa.int64()),
+    pa.field("dispute_reason", pa.string()),
+    pa.field("dispute_amount", pa.float64()),
+])
+
+BRONZE_SCHEMA = pa.schema([
+    pa.field("event_id", pa.string()),
+    pa.field("event_type", pa.string()),
+    pa.field("ts", pa.timestamp("us", tz="UTC")),
+    pa.field("user_id", pa.string()),
+    pa.field("merchant_id", pa.string()),
+    pa.field("order_id", pa.string()),
+    pa.field("device_id", pa.string()),
+    pa.field("city", pa.string()),
+    pa.field("payload_json", PAYLOAD_TYPE),
+    pa.field("payload_raw", pa.string()),
+])
+
+# Keys an event may carry; payload_raw is filled in by the writers
+EVENT_FIELDS = frozenset(BRONZE_SCHEMA.names) - {"payload_raw"}
+
+
+def check_event_fields(fields):
+    """Reject top-level keys the bronze schema has no column for."""
+    unknown = set(fields) - EVENT_FIELDS
+    if unknown:
+        raise ValueError(f"Unknown bronze event fields: {sorted(unknown)}")
+
+
+def raw_payloads(payloads) -> list:
+    """Serialize payloads to JSON strings (exact floats); missing payloads stay None."""
+    dumps = orjson.dumps
+    return [
+        None if p is None else dumps(p, option=orjson.OPT_SERIALIZE_NUMPY).decode()
+        for p in payloads
+    ]
+
+
+def new_part_path(path: Path = BRONZE_PATH) -> Path:
+    path.mkdir(parents=True, exist_ok=True)
+    stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S")
+    return path / f"part-{stamp}-{uuid4().hex[:8]}.parquet"
+
+
+def in_progress_path(part: Path) -> Path:
+    # Dataset scans skip "_"-prefixed files, so a part without its footer is never read
+    return part.with_name(f"_{part.name}")
+
+
+class EventWriter:
+    """
+    Append events to bronze part files, one row group per batch.
+
+    A part is written under its in-progress name and renamed when closed,
+    after max_rows rows or max_seconds after its first event.
+    """
+
+    def __init__(
+        self,
+        path: Path = BRONZE_PATH,
+        batch_size: int = BATCH_SIZE,
+        max_rows: int = PART_MAX_ROWS,
+        max_seconds: float = PART_MAX_SECONDS,
+    ):
+        self.path = path
+        self.batch_size = batch_size
+        self.max_rows = max_rows
+        self.max_seconds = max_seconds
+        self._batch: list[dict] = []
+        self._writer = None
+        self._part = None
+        self._rows = 0
+        self._timer = None
+        # append_event_async and the close timer run in worker threads
+        self._lock = threading.Lock()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def write(self, event: dict):
+        check_event_fields(event)
+        with self._lock:
+            self._batch.append(event)
+            if self._timer is None:
+                self._timer = threading.Timer(self.max_seconds, self.close)
+                self._timer.daemon = True
+                self._timer.start()
+            if len(self._batch) >= self.batch_size:
+                self._flush()
+            if self._rows >= self.max_rows:
+                self._close()
+
+    def flush(self):
+        with self._lock:
+            self._flush()
+
+    def close(self):
+        """Flush and finish the part file; a later write starts a new one."""
+        with self._lock:
+            self._close()
+
+    def _close(self):
+        self._flush()
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if self._writer is not None:
+            self._writer.close()
+            in_progress_path(self._part).rename(self._part)
+            self._writer = None
+            self._part = None
+            self._rows = 0
+
+    def _flush(self):
+        if not self._batch:
+            return
+        # Opened on first flush so an empty run leaves no part file behind
+        if self._writer is None:
+            self._part = new_part_path(self.path)
+            self._writer = pq.ParquetWriter(
+                in_progress_path(self._part), BRONZE_SCHEMA, compression="zstd"
+            )
+        table = pa.Table.from_pylist(self._batch, schema=BRONZE_SCHEMA)
+        raw = raw_payloads([event.get("payload_json") for event in self._batch])
+        table = table.set_column(
+            table.schema.get_field_index("payload_raw"), BRONZE_SCHEMA.field("payload_raw"),
+            pa.array(raw, type=pa.string())
+        )
+        self._writer.write_table(table)
+        self._rows += len(self._batch)
+        self._batch.clear()
+
+
+# One writer per process, so single-event callers share a part file
+_event_writer = EventWriter()
+atexit.register(_event_writer.close)
 
-BRONZE_PATH = Path("data/bronze/bnpl_events.json")
 
 def append_event(event: dict):
-    print(f"Writing event to {BRONZE_PATH.resolve()}")
+    """Buffer one event; readable once its part closes (PART_MAX_SECONDS at most)."""
+    _event_writer.write(event)
+
+
+async def append_event_async(event: dict):
+    """Non-blocking append_event for callers running inside an event loop."""
+    await asyncio.to_thread(append_event, event)
+
+
+def append_events(df: pd.DataFrame):
+    """Append a frame of events as a single bronze part file."""
+    check_event_fields(df.columns)
+    df = df.assign(payload_raw=raw_payloads(df["payload_json"]))
+    table = pa.Table.from_pandas(df, schema=BRONZE_SCHEMA, preserve_index=False)
+    part = new_part_path()
+    pq.write_table(table, in_progress_path(part), compression="zstd")
+    in_progress_path(part).rename(part)
+
+
+def _select_columns(table: pa.Table, columns, payload_fields) -> pd.DataFrame:
+    """Top-level columns plus one flat column per payload field."""
+    # flatten() splits the payload struct into payload_json.<field> columns
+    flat = table.flatten() if payload_fields else table
+    names = list(columns)
+    arrays = [flat.column(c) for c in columns]
+    for field in payload_fields:
+        name = f"payload_json.{field}"
+        # Legacy JSON payloads only carry the fields that were ever written
+        arrays.append(flat.column(name) if name in flat.column_names else pa.nulls(flat.num_rows))
+        names.append(field)
+    return pa.Table.from_arrays(arrays, names=names).to_pandas(integer_object_nulls=True)
+
 
-    BRONZE_PATH.parent.mkdir(parents=True, exist_ok=True)
+def load_bronze_events(columns: list[str], payload_fields: list[str] = ()) -> pd.DataFrame:
+    """
+    Read bronze events from the Parquet dataset and the legacy JSON file.
 
-    event["ts"] = event["ts"].isoformat()
-    print(f"Writing event to {BRONZE_PATH.resolve()}")
+    Returns the requested top-level columns followed by one column per
+    requested payload field, named after the field.
+    """
+    read_columns = list(columns) + (["payload_json"] if payload_fields else [])
 
+    frames = []
+    if any(BRONZE_PATH.glob("part-*.parquet")):
+        table = pq.read_table(BRONZE_PATH, columns=read_columns)
+        frames.append(_select_columns(table, columns, payload_fields))
+    if BRONZE_JSON_PATH.exists():
+        table = pj.read_json(BRONZE_JSON_PATH).select(read_columns)
+        frame = _select_columns(table, columns, payload_fields)
+        if "ts" in frame:
+            frame["ts"] = pd.to_datetime(frame["ts"], format="ISO8601", utc=True)
+        frames.append(frame)
 
-    with open(BRONZE_PATH, "a", encoding="utf-8") as f:
-        f.write(json.dumps(event) + "\n")
+    if not frames:
+        raise FileNotFoundError(
+            f"No bronze events found in {BRONZE_PATH} or {BRONZE_JSON_PATH}"
+        )
+    return pd.concat(frames, ignore_index=True)
 
 
 if __name__ == "__main__":
@@ -32,3 +258,4 @@ if __name__ == "__main__":
 
     # 🔴 THIS LINE MUST EXIST
     append_event(sample_event)
+    print(f"✅ Sample event written to {BRONZE_PATH}")
@@ -0,0 +1,67 @@
+import numpy as np
+import pandas as pd
+from pathlib import Path
+
+# --------------------
+# PATHS
+# --------------------
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+
+SILVER_PATH = PROJECT_ROOT / "data" / "silver"
+ORDERS_PATH = SILVER_PATH / "orders.csv"
+USERS_PATH = SILVER_PATH / "users.csv"
+CHECKOUT_EVENTS_PATH = SILVER_PATH / "checkout_events.csv"
+
+rng = np.random.default_rng()
+
+
+def build_checkout_events(orders: pd.DataFrame, users: pd.DataFrame) -> pd.DataFrame:
+    orders = orders.merge(users[["user_id", "kyc_level"]], on="user_id", how="left")
+    orders["order_date"] = pd.to_datetime(orders["order_date"], format="ISO8601")
+
+    # ---------- ABANDONMENT ----------
+    n = len(orders)
+    abandon_prob = (
+        np.full(n, 0.05)
+        + 0.15 * (orders["kyc_level"].values == "basic")
+        + 0.40 * (orders["status"].values == "rejected")
+    )
+    abandoned = rng.random(n) < abandon_prob
+
+    # ---------- EVENTS ----------
+    base = orders[["order_id", "user_id"]]
+
+    starts = base.assign(event_type="checkout_start", event_date=orders["order_date"])
+    abandons = base[abandoned].assign(
+        event_type="checkout_abandon",
+        event_date=orders["order_date"][abandoned] + pd.Timedelta(minutes=2)
+    )
+    successes = base[~abandoned].assign(
+        event_type="checkout_success",
+        event_date=orders["order_date"][~abandoned] + pd.Timedelta(minutes=3)
+    )
+
+    # Keep each order's start directly before its outcome
+    events = pd.concat([starts, abandons, successes]).sort_index(kind="stable")
+    events = events.reset_index(drop=True)
+
+    events.insert(0, "checkout_event_id", np.char.add(
+        "chk_", np.char.zfill(np.arange(1, len(events) + 1).astype(str), 7)
+    ))
+
+    return events
+
+
+def main():
+    SILVER_PATH.mkdir(parents=True, exist_ok=True)
+
+    orders = pd.read_csv(ORDERS_PATH)
+    users = pd.read_csv(USERS_PATH)
+    checkout_events = build_checkout_events(orders, users)
+
+    checkout_events.to_csv(CHECKOUT_EVENTS_PATH, index=False)
+    print(f"✅ Silver checkout events table created: {CHECKOUT_EVENTS_PATH}")
+
+
+if __name__ == "__main__":
+    main()
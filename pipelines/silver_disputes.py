@@ -1,20 +1,23 @@
-import json
 import pandas as pd
 from pathlib import Path
 
+from ingest_events import load_bronze_events
+
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
-BRONZE_PATH = PROJECT_ROOT / "data" / "bronze" / "bnpl_events.json"
 SILVER_PATH = PROJECT_ROOT / "data" / "silver"
 DISPUTES_PATH = SILVER_PATH / "disputes.csv"
 
-def load_bronze_events():
-    events = []
-    with open(BRONZE_PATH, "r", encoding="utf-8") as f:
-        for line in f:
-            events.append(json.loads(line))
-    df = pd.DataFrame(events)
-    df["ts"] = pd.to_datetime(df["ts"])
-    return df
+BRONZE_COLUMNS = [
+    "event_id",
+    "event_type",
+    "ts",
+    "user_id",
+    "merchant_id",
+    "order_id"
+]
+
+# Payload fields, read as their own columns
+PAYLOAD_FIELDS = ["dispute_reason"]
 
 def build_disputes(df: pd.DataFrame) -> pd.DataFrame:
     # Filter for dispute events
@@ -24,8 +27,7 @@ def build_disputes(df: pd.DataFrame) -> pd.DataFrame:
         print("No DISPUTE events found.")
         return pd.DataFrame(columns=["dispute_id", "order_id", "user_id", "merchant_id", "dispute_date", "reason", "status"])
 
-    # Extract fields
-    disputes["reason"] = disputes["payload_json"].apply(lambda x: x.get("dispute_reason"))
+    disputes["reason"] = disputes["dispute_reason"]
     # disputes["status"] = "open" # Default status or derive?
     # Schema has 'status'. The payload doesn't seem to have it.
     # In one example payload: {"dispute_reason": "refund", "dispute_amount": 1691}
@@ -52,7 +54,7 @@ def build_disputes(df: pd.DataFrame) -> pd.DataFrame:
 
 def main():
     SILVER_PATH.mkdir(parents=True, exist_ok=True)
-    df_events = load_bronze_events()
+    df_events = load_bronze_events(BRONZE_COLUMNS, PAYLOAD_FIELDS)
     disputes = build_disputes(df_events)
     disputes.to_csv(DISPUTES_PATH, index=False)
     print(f"✅ Silver disputes table created: {DISPUTES_PATH}")
@@ -1,33 +1,39 @@
-import json
 import pandas as pd
 from pathlib import Path
 
+from ingest_events import load_bronze_events
+
 # --------------------
 # PATHS
 # --------------------
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
 
-BRONZE_PATH = PROJECT_ROOT / "data" / "bronze" / "bnpl_events.json"
 SILVER_PATH = PROJECT_ROOT / "data" / "silver"
 INSTALLMENTS_PATH = SILVER_PATH / "installments.csv"
 
-
-def load_bronze_events():
-    events = []
-    with open(BRONZE_PATH, "r", encoding="utf-8") as f:
-        for line in f:
-            events.append(json.loads(line))
-    df = pd.DataFrame(events)
-    df["ts"] = pd.to_datetime(df["ts"])
-    return df
+BRONZE_COLUMNS = [
+    "event_id",
+    "event_type",
+    "ts",
+    "user_id",
+    "merchant_id",
+    "order_id"
+]
+
+# Payload fields, read as their own columns
+PAYLOAD_FIELDS = [
+    "installment_id",
+    "due_date",
+    "installment_amount",
+    "paid_date",
+    "late_days"
+]
 
 
 def build_installments(df: pd.DataFrame) -> pd.DataFrame:
     # ---------- DUE ----------
     due = df[df["event_type"] == "INST_DUE"].copy()
-    due["installment_id"] = due["payload_json"].apply(lambda x: x["installment_id"])
-    due["due_date"] = pd.to_datetime(due["payload_json"].apply(lambda x: x["due_date"]))
-    due["installment_amount"] = due["payload_json"].apply(lambda x: x["installment_amount"])
+    due["due_date"] = pd.to_datetime(due["due_date"])
 
     due = due[[
         "installment_id",
@@ -40,8 +46,7 @@ def build_installments(df: pd.DataFrame) -> pd.DataFrame:
 
     # ---------- PAID ----------
     paid = df[df["event_type"] == "INST_PAID"].copy()
-    paid["installment_id"] = paid["payload_json"].apply(lambda x: x["installment_id"])
-    paid["paid_date"] = pd.to_datetime(paid["payload_json"].apply(lambda x: x["paid_date"]))
+    paid["paid_date"] = pd.to_datetime(paid["paid_date"])
 
     paid = paid[[
         "installment_id",
@@ -50,8 +55,6 @@ def build_installments(df: pd.DataFrame) -> pd.DataFrame:
 
     # ---------- LATE ----------
     late = df[df["event_type"] == "INST_LATE"].copy()
-    late["installment_id"] = late["payload_json"].apply(lambda x: x["installment_id"])
-    late["late_days"] = late["payload_json"].apply(lambda x: x["late_days"])
     late["paid_date"] = late["ts"]
 
     late = late[[
@@ -94,7 +97,7 @@ def build_installments(df: pd.DataFrame) -> pd.DataFrame:
 def main():
     SILVER_PATH.mkdir(parents=True, exist_ok=True)
 
-    df_events = load_bronze_events()
+    df_events = load_bronze_events(BRONZE_COLUMNS, PAYLOAD_FIELDS)
     installments = build_installments(df_events)
 
     installments.to_csv(INSTALLMENTS_PATH, index=False)
@@ -1,38 +1,37 @@
-import json
+import numpy as np
 import pandas as pd
 from pathlib import Path
 
+from ingest_events import load_bronze_events
+
 # --------------------
 # PATHS
 # --------------------
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
 
-BRONZE_PATH = PROJECT_ROOT / "data" / "bronze" / "bnpl_events.json"
 SILVER_PATH = PROJECT_ROOT / "data" / "silver"
 ORDERS_PATH = SILVER_PATH / "orders.csv"
 
+BRONZE_COLUMNS = [
+    "event_id",
+    "event_type",
+    "ts",
+    "user_id",
+    "merchant_id",
+    "order_id"
+]
 
-def load_bronze_events():
-    events = []
-    with open(BRONZE_PATH, "r", encoding="utf-8") as f:
-        for line in f:
-            events.append(json.loads(line))
-    df = pd.DataFrame(events)
-    df["ts"] = pd.to_datetime(df["ts"])
-    return df
+# Payload fields, read as their own columns
+PAYLOAD_FIELDS = ["amount", "currency", "installments_count"]
 
 
 def build_orders(df: pd.DataFrame) -> pd.DataFrame:
     orders = df[df["event_type"].isin(["ORDER_OK", "ORDER_REJ"])].copy()
 
-    orders["status"] = orders["event_type"].apply(
-        lambda x: "approved" if x == "ORDER_OK" else "rejected"
-    )
-
-    orders["amount"] = orders["payload_json"].apply(lambda x: x.get("amount"))
-    orders["currency"] = orders["payload_json"].apply(lambda x: x.get("currency"))
-    orders["installments_count"] = orders["payload_json"].apply(
-        lambda x: x.get("installments_count")
+    # Stored as int8 codes; the CSV output is unchanged
+    orders["status"] = pd.Categorical.from_codes(
+        (orders["event_type"].values == "ORDER_REJ").astype(np.int8),
+        categories=["approved", "rejected"]
     )
 
     orders = orders[[
@@ -55,7 +54,7 @@ def build_orders(df: pd.DataFrame) -> pd.DataFrame:
 def main():
     SILVER_PATH.mkdir(parents=True, exist_ok=True)
 
-    df_events = load_bronze_events()
+    df_events = load_bronze_events(BRONZE_COLUMNS, PAYLOAD_FIELDS)
     orders = build_orders(df_events)
 
     orders.to_csv(ORDERS_PATH, index=False)
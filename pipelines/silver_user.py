@@ -1,17 +1,23 @@
 import pandas as pd
 from pathlib import Path
 
+from ingest_events import load_bronze_events
+
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
 
-BRONZE_PATH = PROJECT_ROOT / "data" / "bronze" / "bnpl_events.json"
 SILVER_PATH = PROJECT_ROOT / "data" / "silver"
 USERS_PATH = SILVER_PATH / "users.csv"
 
+BRONZE_COLUMNS = [
+    "event_id",
+    "event_type",
+    "ts",
+    "user_id",
+    "city"
+]
 
-def load_bronze_events():
-    df = pd.read_json(BRONZE_PATH, lines=True)
-    df["ts"] = pd.to_datetime(df["ts"])
-    return df
+# Payload fields, read as their own columns
+PAYLOAD_FIELDS = ["kyc_level"]
 
 
 def build_users(df_events: pd.DataFrame) -> pd.DataFrame:
@@ -20,7 +26,6 @@ def build_users(df_events: pd.DataFrame) -> pd.DataFrame:
     signup = signup[["user_id", "signup_date", "city"]]
 
     kyc = df_events[df_events["event_type"] == "KYC_OK"].copy()
-    kyc["kyc_level"] = kyc["payload_json"].apply(lambda x: x.get("kyc_level"))
     kyc = kyc[["user_id", "kyc_level"]]
 
     users = signup.merge(kyc, on="user_id", how="left")
@@ -44,7 +49,7 @@ def build_users(df_events: pd.DataFrame) -> pd.DataFrame:
 def main():
     SILVER_PATH.mkdir(parents=True, exist_ok=True)
 
-    df_events = load_bronze_events()
+    df_events = load_bronze_events(BRONZE_COLUMNS, PAYLOAD_FIELDS)
     print("Loaded columns:", df_events.columns.tolist())
 
     users = build_users(df_events)